@@ -5,12 +5,28 @@ Script to create a Hugging Face dataset from BNE Digital Hemeroteca publications
 Combines the CSV metadata with corresponding images into a single Parquet file.
 """
 
+import math
+import mimetypes
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator, Dict, Any, Optional
 
 import pandas as pd
-from datasets import Dataset, Features, Image, Value
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datasets import Features, Image, Value
+
+# Columns stored as nullable integers
+INTEGER_COLUMNS = ("issues_count", "total_pages")
+
+# Image prefetching: reader threads and how many rows to read ahead
+IMAGE_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+IMAGE_PREFETCH = 64
+
+# Rows per parquet row group
+PARQUET_BATCH_SIZE = 512
 
 
 def get_data_paths() -> tuple[Path, Path, Path]:
@@ -24,50 +40,96 @@ def get_data_paths() -> tuple[Path, Path, Path]:
     return csv_path, images_dir, output_path
 
 
-def generate_rows(df: pd.DataFrame, images_dir: Path) -> Iterator[Dict[str, Any]]:
+def get_available_images(images_dir: Path) -> Dict[str, str]:
+    """
+    Map each UUID that has an image to its file name, using a single directory scan.
+    
+    Any image extension is accepted (.jpg, .png, .webp, ...), matching the
+    extensions the scraper derives from the served Content-Type.
+    """
+    with os.scandir(images_dir) as entries:
+        return {
+            os.path.splitext(entry.name)[0]: entry.name
+            for entry in entries
+            if (mimetypes.guess_type(entry.name)[0] or "").startswith("image/") and entry.is_file()
+        }
+
+
+def read_image_bytes(image_path: Path) -> bytes:
+    """Read the raw bytes of an image."""
+    with open(image_path, "rb") as f:
+        return f.read()
+
+
+def generate_rows(df: pd.DataFrame, images_dir: Path, available_images: Dict[str, str]) -> Iterator[Dict[str, Any]]:
     """
     Generator that yields rows with image data.
     
-    For each row in the DataFrame, checks if the corresponding image exists
-    and includes it in the output dictionary as raw bytes.
+    For each row in the DataFrame whose UUID is in `available_images`, includes
+    the corresponding image in the output dictionary as raw bytes. Images are
+    read by a thread pool a few rows ahead of the consumer, so disk reads
+    overlap with the Arrow writing done by the caller.
     """
-    for _, row in df.iterrows():
-        uuid = row["uuid"]
-        image_path = images_dir / f"{uuid}.jpg"
-        
+    # Coerce integer columns once for the whole column instead of per row;
+    # truncate first, as int() did, so non-integral values don't fail the cast
+    integer_columns = [col for col in INTEGER_COLUMNS if col in df.columns]
+    df = df.assign(**{
+        col: pd.to_numeric(df[col], errors="coerce").map(math.trunc, na_action="ignore").astype("Int64")
+        for col in integer_columns
+    })
+    
+    # Iterate plain tuples instead of per-row Series; resolve column positions once
+    uuid_idx = df.columns.get_loc("uuid")
+    columns = [col for col in df.columns if col != "uuid"]
+    
+    def build_row(row: tuple, image_bytes: Optional[bytes]) -> Dict[str, Any]:
         # Create a dictionary with all CSV columns except uuid
-        row_dict = row.to_dict()
-        row_dict.pop("uuid", None)
+        row_dict = dict(zip(columns, (v for i, v in enumerate(row) if i != uuid_idx)))
         
-        # Convert integer columns to proper integers or None
-        if "issues_count" in row_dict:
-            val = row_dict["issues_count"]
-            try:
-                row_dict["issues_count"] = int(val) if pd.notna(val) and str(val).strip() != "" else None
-            except (ValueError, TypeError):
-                row_dict["issues_count"] = None
+        # Int64 columns hold pd.NA for missing values; the schema expects None
+        for col in integer_columns:
+            val = row_dict[col]
+            row_dict[col] = None if pd.isna(val) else int(val)
         
-        if "total_pages" in row_dict:
-            val = row_dict["total_pages"]
-            try:
-                row_dict["total_pages"] = int(val) if pd.notna(val) and str(val).strip() != "" else None
-            except (ValueError, TypeError):
-                row_dict["total_pages"] = None
-        
-        # Load and add image if it exists, otherwise None
-        if image_path.exists():
-            # Read image bytes directly to ensure embedding
-            with open(image_path, "rb") as f:
-                image_bytes = f.read()
-            image_data = {"bytes": image_bytes, "path": None}
-        else:
-            image_data = None
+        # Embed the image bytes directly, otherwise None
+        image_data = {"bytes": image_bytes, "path": None} if image_bytes is not None else None
         
         # Create ordered dictionary with image first
         ordered_dict = {"image": image_data}
         ordered_dict.update(row_dict)
+        return ordered_dict
+    
+    # Rows sharing a UUID reuse one image read; the shared read is dropped
+    # once its last occurrence has been scheduled
+    duplicate_counts = df["uuid"].value_counts()
+    remaining = duplicate_counts[duplicate_counts > 1].to_dict()
+    shared_reads = {}
+    
+    # Sliding window of (row, pending image read), consumed in CSV order
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=IMAGE_READ_WORKERS) as executor:
+        for row in df.itertuples(index=False, name=None):
+            uuid = row[uuid_idx]
+            future = None
+            if uuid in available_images:
+                if uuid in remaining:
+                    future = shared_reads.pop(uuid, None)
+                    if future is None:
+                        future = executor.submit(read_image_bytes, images_dir / available_images[uuid])
+                    remaining[uuid] -= 1
+                    if remaining[uuid] > 0:
+                        shared_reads[uuid] = future
+                else:
+                    future = executor.submit(read_image_bytes, images_dir / available_images[uuid])
+            pending.append((row, future))
+            
+            if len(pending) >= IMAGE_PREFETCH:
+                row, future = pending.popleft()
+                yield build_row(row, future.result() if future else None)
         
-        yield ordered_dict
+        while pending:
+            row, future = pending.popleft()
+            yield build_row(row, future.result() if future else None)
 
 
 def create_dataset_features(df: pd.DataFrame) -> Features:
@@ -77,16 +139,13 @@ def create_dataset_features(df: pd.DataFrame) -> Features:
     # Add image column first
     feature_dict["image"] = Image(decode=True)
     
-    # Integer columns
-    integer_columns = {"issues_count", "total_pages"}
-    
     # Add all CSV columns as Value features, except uuid
     for col in df.columns:
         if col == "uuid":  # Exclude uuid from the dataset
             continue
         
         # Set appropriate types
-        if col in integer_columns:
+        if col in INTEGER_COLUMNS:
             feature_dict[col] = Value("int64", id=None)  # int64 for nullable integers
         else:
             feature_dict[col] = Value("string")
@@ -94,6 +153,51 @@ def create_dataset_features(df: pd.DataFrame) -> Features:
     return Features(feature_dict)
 
 
+def write_parquet(
+    rows: Iterator[Dict[str, Any]],
+    features: Features,
+    output_path: Path,
+    batch_size: int = PARQUET_BATCH_SIZE,
+) -> tuple[int, int]:
+    """
+    Write rows to a parquet file in row-group batches.
+    
+    Rows are encoded with the dataset features and the Hugging Face schema
+    metadata is kept, so the file loads with the same features as a
+    `datasets` export. The file is written under a temporary name and only
+    replaces `output_path` once every row has been written. Returns the number
+    of rows and of rows with an image.
+    """
+    schema = features.arrow_schema
+    tmp_path = output_path.with_suffix(".parquet.tmp")
+    num_rows = 0
+    rows_with_images = 0
+    batch = []
+    
+    try:
+        with pq.ParquetWriter(tmp_path, schema, compression="zstd") as writer:
+            for row in rows:
+                if row["image"] is not None:
+                    rows_with_images += 1
+                batch.append(features.encode_example(row))
+                
+                if len(batch) >= batch_size:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    num_rows += len(batch)
+                    batch.clear()
+            
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                num_rows += len(batch)
+    except BaseException:
+        # Leave any previous output untouched rather than a truncated file
+        tmp_path.unlink(missing_ok=True)
+        raise
+    
+    os.replace(tmp_path, output_path)
+    return num_rows, rows_with_images
+
+
 def main():
     """Main function to create the Hugging Face dataset."""
     csv_path, images_dir, output_path = get_data_paths()
@@ -111,33 +215,27 @@ def main():
         raise FileNotFoundError(f"Images directory not found: {images_dir}")
     
     # Count available images
-    available_images = sum(1 for uuid in df["uuid"] if (images_dir / f"{uuid}.jpg").exists())
-    print(f"Found {available_images} matching images out of {len(df)} rows")
+    available_images = get_available_images(images_dir)
+    matching_images = int(df["uuid"].isin(available_images.keys()).sum())
+    print(f"Found {matching_images} matching images out of {len(df)} rows")
     
     # Define features schema
     features = create_dataset_features(df)
     
     print("Creating dataset...")
-    # Create dataset from generator
-    dataset = Dataset.from_generator(
-        lambda: generate_rows(df, images_dir),
-        features=features,
-    )
-    
-    print(f"Dataset created with {len(dataset)} rows")
     print(f"Saving to: {output_path}")
     
-    # Save to parquet
-    dataset.to_parquet(output_path)
+    # Stream rows straight into the parquet file
+    num_rows, rows_with_images = write_parquet(generate_rows(df, images_dir, available_images), features, output_path)
+    print(f"Dataset created with {num_rows} rows")
     
     # Get file size
     file_size_mb = output_path.stat().st_size / (1024 * 1024)
     print(f"Dataset saved successfully! Size: {file_size_mb:.2f} MB")
     
     # Print some statistics
-    rows_with_images = sum(1 for img in dataset["image"] if img is not None)
     print(f"Rows with images: {rows_with_images}")
-    print(f"Rows without images: {len(dataset) - rows_with_images}")
+    print(f"Rows without images: {num_rows - rows_with_images}")
 
 
 if __name__ == "__main__":
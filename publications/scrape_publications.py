@@ -15,7 +15,9 @@ available publications. It performs the following steps:
       and allow the script to be stopped and restarted.
 
 3.  **Detailed Scraping**:
-    - Visits the specific detail page for each new publication.
+    - Visits the specific detail page for each new publication, using a small pool of
+      worker threads. Pages are parsed from their plain HTML when possible; otherwise the
+      worker falls back to its own browser instance.
     - Extracts metadata fields such as:
         - Titles (Main and alternative)
         - Collection and Description
@@ -34,16 +36,23 @@ available publications. It performs the following steps:
     - Appends the collected data (including the UUID and image status) to `data/publications/list.csv`.
     - Saves images to `data/publications/images/`.
 """
-import requests
+import httpx
 import csv
-import os
+import mimetypes
 import time
 import uuid
 import random
-from typing import List, Dict, Set, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, List, Dict, Set, Optional
+import lxml.html
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from urllib.parse import urljoin
@@ -51,17 +60,72 @@ from urllib.parse import urljoin
 # Configuration
 BASE_URL = "https://hemerotecadigital.bne.es"
 START_URL = "https://hemerotecadigital.bne.es/hd/es/fulltext"
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
 
 # Updated output path
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "data", "publications")
-IMAGES_DIR = os.path.join(OUTPUT_DIR, "images")
-OUTPUT_FILE = os.path.join(OUTPUT_DIR, "list.csv")
+OUTPUT_DIR = PROJECT_ROOT / "data" / "publications"
+IMAGES_DIR = OUTPUT_DIR / "images"
+OUTPUT_FILE = OUTPUT_DIR / "list.csv"
+
+# Collects the detail page contents in-browser, so each page costs one WebDriver call.
+# Fields follow the structure:
+# <div class="field"> <label class="label">Text</label> <div class="control">Value</div> </div>
+DETAIL_PAGE_SCRIPT = """
+const fields = [];
+document.querySelectorAll('label.label').forEach(label => {
+    const control = label.parentElement.querySelector('div.control');
+    if (control) {
+        fields.push([label.textContent, control.innerText.trim()]);
+    }
+});
+const title = document.querySelector('h2.title');
+const issuesLink = Array.from(document.querySelectorAll('a'))
+    .find(a => a.textContent.includes('Ejemplares'));
+// Snippet: <img src="..." class="has-border" loading="lazy">
+// It is inside a div with class "field has-text-centered"
+const image = document.querySelector('div.field.has-text-centered img.has-border');
+return {
+    title: title ? title.innerText.trim() : null,
+    fields: fields,
+    issues_link: issuesLink ? issuesLink.href : null,
+    image_src: image ? image.src : null
+};
+"""
+
+# Compiled once and reused for every statically parsed detail page
+LABEL_XPATH = etree.XPath("//label[contains(@class, 'label')]")
+CONTROL_XPATH = etree.XPath(".//div[contains(@class, 'control')]")
+TITLE_XPATH = etree.XPath("//h2[contains(@class, 'title')]")
+ISSUES_LINK_XPATH = etree.XPath("//a[contains(., 'Ejemplares')]/@href")
+IMAGE_SRC_XPATH = etree.XPath(
+    "//div[contains(@class, 'field') and contains(@class, 'has-text-centered')]"
+    "//img[contains(@class, 'has-border')]/@src"
+)
+
+# Elements that start a new line in innerText; everything else is inline
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "figcaption",
+    "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li",
+    "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul",
+}
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Requests the browser never needs to make (analytics, ads, web fonts)
+BLOCKED_URL_PATTERNS = ["*google-analytics*", "*googletagmanager*", "*doubleclick*", "*.woff2"]
+
+# Number of browser instances scraping detail pages in parallel
+MAX_WORKERS = 4
+
+# Delay range (seconds) each worker waits after a publication. The request rate to BNE
+# scales with MAX_WORKERS, so don't shorten this without checking it is safe.
+POLITE_DELAY = (1.0, 2.0)
+
+# Scraped records are written to the CSV in batches of this size
+CSV_FLUSH_EVERY = 20
 
 # Ensure output directories exist
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-os.makedirs(IMAGES_DIR, exist_ok=True)
+IMAGES_DIR.mkdir(parents=True, exist_ok=True)
 
 def setup_driver() -> webdriver.Chrome:
     """Configures and starts the Selenium WebDriver."""
@@ -76,8 +140,16 @@ def setup_driver() -> webdriver.Chrome:
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     options.add_argument("--window-size=1920,1080")
     
-    # options.add_argument("--headless") 
+    # Only the DOM is needed: return at DOMContentLoaded and skip rendering images
+    # (covers are fetched separately over HTTP)
+    options.page_load_strategy = "eager"
+    options.add_argument("--headless=new")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
+    # Each driver launches its own chromedriver. It starts quickly, and webdriver.Chrome
+    # also resolves the browser binary (including one provided by Selenium Manager),
+    # which a shared service with Remote sessions would have to duplicate.
     driver = webdriver.Chrome(options=options)
     
     # Execute CDP command to further hide webdriver property
@@ -88,30 +160,90 @@ def setup_driver() -> webdriver.Chrome:
             })
         """
     })
+    
+    # Skip trackers and web fonts; none of them are needed to read the pages
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+# One WebDriver per worker thread; every driver created is tracked so it can be quit
+_thread_local = threading.local()
+_drivers: List[webdriver.Chrome] = []
+_drivers_lock = threading.Lock()
+
+def get_driver() -> webdriver.Chrome:
+    """Returns the WebDriver owned by the current thread, starting one if needed."""
+    driver = getattr(_thread_local, "driver", None)
+    if driver is None:
+        driver = setup_driver()
+        _thread_local.driver = driver
+        with _drivers_lock:
+            _drivers.append(driver)
     return driver
 
-def extract_field(driver: webdriver.Chrome, label_text: str) -> str:
+def discard_driver() -> None:
+    """Quits and forgets the current thread's WebDriver, so its next task starts a new one."""
+    driver = getattr(_thread_local, "driver", None)
+    if driver is None:
+        return
+    _thread_local.driver = None
+    with _drivers_lock:
+        if driver in _drivers:
+            _drivers.remove(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def quit_drivers() -> None:
+    """Quits every WebDriver started by get_driver."""
+    with _drivers_lock:
+        drivers = list(_drivers)
+        _drivers.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Warning: Could not quit driver: {e}")
+
+def setup_client() -> httpx.Client:
+    """Creates an HTTP/2 client that multiplexes requests to the BNE host over shared connections."""
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        headers={"User-Agent": "Mozilla/5.0"},
+        timeout=10,
+        follow_redirects=True,
+    )
+
+def extract_page_data(driver: webdriver.Chrome) -> Dict[str, Any]:
     """
-    Extracts text from a div sibling/control associated with a label.
+    Reads everything needed from a detail page in a single script execution.
     
     Args:
         driver: Selenium WebDriver instance.
+        
+    Returns:
+        Dictionary with the title, the (label, value) field pairs in page order,
+        the issues link and the image source. Missing elements are None.
+    """
+    return driver.execute_script(DETAIL_PAGE_SCRIPT)
+
+def find_field(fields: List[List[str]], label_text: str) -> str:
+    """
+    Finds the value of the first field whose label contains the given text.
+    
+    Args:
+        fields: (label, value) pairs as returned by extract_page_data.
         label_text: The text of the label to search for.
         
     Returns:
         The text content of the associated field, or empty string if not found.
     """
-    try:
-        # Strategy: Find label containing text, then find the associated value
-        # The structure is typically:
-        # <div class="field"> <label>Text</label> <div class="control">Value</div> </div>
-        
-        # XPath: Find label with text, go up to parent div, find child div with class 'control'
-        xpath = f"//label[contains(@class, 'label') and contains(text(), '{label_text}')]/parent::div//div[contains(@class, 'control')]"
-        element = driver.find_element(By.XPATH, xpath)
-        return element.text.strip()
-    except Exception:
-        return ""
+    for label, value in fields:
+        if label_text in label:
+            return value
+    return ""
 
 def get_existing_issns() -> Set[str]:
     """
@@ -119,20 +251,23 @@ def get_existing_issns() -> Set[str]:
     
     Returns:
         Set of ISSN strings.
+        
+    Raises:
+        ValueError: If the output file exists but has no issn column. Resuming
+            with an empty set would re-scrape and duplicate every publication.
     """
-    if not os.path.exists(OUTPUT_FILE):
+    if not OUTPUT_FILE.exists() or OUTPUT_FILE.stat().st_size == 0:
         return set()
     
-    existing = set()
-    try:
-        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if "issn" in row and row["issn"]:
-                    existing.add(row["issn"])
-    except Exception as e:
-        print(f"Warning: Could not read existing CSV: {e}")
-    return existing
+    # Plain rows are enough to pick the ISSN column, and csv tolerates a last
+    # record cut off mid-field by an interrupted run
+    with open(OUTPUT_FILE, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "issn" not in header:
+            raise ValueError(f"Cannot resume: no 'issn' column in {OUTPUT_FILE}")
+        issn_idx = header.index("issn")
+        return {row[issn_idx] for row in reader if len(row) > issn_idx and row[issn_idx]}
 
 def scrape_main_list(driver: webdriver.Chrome) -> List[Dict[str, str]]:
     """
@@ -186,140 +321,283 @@ def scrape_main_list(driver: webdriver.Chrome) -> List[Dict[str, str]]:
             
     return publication_data_list
 
-def download_image(driver: webdriver.Chrome, item_uuid: str, output_dir: str, title: str) -> None:
+def download_image(client: httpx.Client, img_src: Optional[str], item_uuid: str, output_dir: Path, title: str) -> None:
     """
     Attempts to download the publication image.
     
     Args:
-        driver: Selenium WebDriver instance.
+        client: HTTP client used to fetch the image.
+        img_src: Image URL read from the detail page, None if there is no image.
         item_uuid: UUID of the item (used for filename).
         output_dir: Directory to save the image.
         title: Title of the publication (for logging).
     """
+    if not img_src:
+        # Image might not exist
+        return
+    
+    # Use the shared client to download image
     try:
-        # Wait for image to be loaded (using loading="lazy" might delay it, 
-        # so we explicitly wait for the element)
-        # Snippet: <img src="..." class="has-border" loading="lazy">
-        # It is inside a div with class "field has-text-centered"
+        with client.stream("GET", img_src) as img_response:
+            if img_response.status_code == 200:
+                # Determine extension from the served image type, default to jpg
+                # (e.g. for application/octet-stream, which would map to .bin)
+                content_type = img_response.headers.get("Content-Type", "image/jpeg").split(";")[0].strip()
+                ext = ".jpg"
+                if content_type.startswith("image/"):
+                    ext = mimetypes.guess_extension(content_type) or ".jpg"
+                
+                # Write the (decoded) body in large blocks
+                img_path = output_dir / f"{item_uuid}{ext}"
+                with img_path.open('wb') as img_file:
+                    for chunk in img_response.iter_bytes(64 * 1024):
+                        img_file.write(chunk)
+                print(f"Downloaded image for {title}")
+    except Exception as e:
+        print(f"Failed to download image: {e}")
+
+def clean_text(element: lxml.html.HtmlElement) -> str:
+    """
+    Returns the text of an element the way the browser's innerText renders it.
+    
+    Source whitespace collapses to single spaces; only <br> and block elements
+    break lines, so the static and Selenium paths produce the same values.
+    """
+    chunks = []
+    
+    def walk(el: lxml.html.HtmlElement) -> None:
+        if not isinstance(el.tag, str) or el.tag in ("script", "style"):
+            return
+        if el.tag == "br" or el.tag in BLOCK_TAGS:
+            chunks.append("\n")
+        if el.text:
+            chunks.append(WHITESPACE_RE.sub(" ", el.text))
+        for child in el:
+            walk(child)
+            if child.tail:
+                chunks.append(WHITESPACE_RE.sub(" ", child.tail))
+        if el.tag in BLOCK_TAGS:
+            chunks.append("\n")
+    
+    walk(element)
+    lines = (line.strip() for line in "".join(chunks).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+def fetch_detail_static(client: httpx.Client, url: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads a detail page from its server-rendered HTML, without a browser.
+    
+    Args:
+        client: HTTP client used to fetch the page.
+        url: Link to the publication detail page.
         
-        img_element = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.field.has-text-centered img.has-border"))
-        )
-        img_src = img_element.get_attribute("src")
+    Returns:
+        Page contents in the same shape as extract_page_data, or None if the page
+        lacks the expected structure (e.g. it is rendered by JS).
         
-        if img_src:
-            # Use requests to download image
-            try:
-                img_response = requests.get(img_src, stream=True, headers={"User-Agent": "Mozilla/5.0"})
-                if img_response.status_code == 200:
-                    # Determine extension, default to jpg
-                    ext = ".jpg"
-                    if "png" in img_src: ext = ".png"
-                    elif "gif" in img_src: ext = ".gif"
-                    
-                    img_filename = f"{item_uuid}{ext}"
-                    img_path = os.path.join(output_dir, img_filename)
-                    
-                    with open(img_path, 'wb') as img_file:
-                        for chunk in img_response.iter_content(1024):
-                            img_file.write(chunk)
-                    print(f"Downloaded image for {title}")
-            except Exception as e:
-                print(f"Failed to download image: {e}")
+    Raises:
+        httpx.HTTPError: If the request fails or the server answers with an error
+            status (e.g. 429 or 5xx). Loading the page in a browser would only add
+            load when the server is asking clients to back off.
+    """
+    response = client.get(url)
+    response.raise_for_status()
+    try:
+        # Honour a charset from the Content-Type header; otherwise let lxml
+        # detect it from the page itself (<meta charset>)
+        charset = response.charset_encoding
+        parser = lxml.html.HTMLParser(encoding=charset) if charset else None
+        tree = lxml.html.fromstring(response.content, parser=parser, base_url=url)
+        tree.make_links_absolute(url)
     except Exception:
-        # Image might not exist or timeout
-        pass
+        return None
+    
+    # Same structure as DETAIL_PAGE_SCRIPT, walked once
+    fields = []
+    for label in LABEL_XPATH(tree):
+        controls = CONTROL_XPATH(label.getparent())
+        if controls:
+            fields.append([label.text_content(), clean_text(controls[0])])
+    
+    titles = TITLE_XPATH(tree)
+    if not titles or not fields:
+        return None
+    
+    issues_links = ISSUES_LINK_XPATH(tree)
+    image_srcs = IMAGE_SRC_XPATH(tree)
+    return {
+        "title": clean_text(titles[0]),
+        "fields": fields,
+        "issues_link": issues_links[0] if issues_links else None,
+        "image_src": image_srcs[0] if image_srcs else None,
+    }
 
-def scrape_publication_details(driver: webdriver.Chrome, pub: Dict[str, str]) -> Optional[Dict[str, str]]:
+def scrape_publication_static(client: httpx.Client, pub: Dict[str, str]) -> Optional[Dict[str, Any]]:
     """
-    Scrapes detailed information for a single publication.
+    Scrapes detailed information for a single publication over plain HTTP.
     
     Args:
-        driver: Selenium WebDriver instance.
+        client: HTTP client used to fetch the page and the image.
         pub: Basic publication info (ISSN, Title, Link).
         
     Returns:
-        Dictionary with full publication details or None if error.
+        Dictionary with full publication details, or None if the page has to be
+        scraped with Selenium instead.
+        
+    Raises:
+        httpx.HTTPError: If the page could not be fetched (see fetch_detail_static).
     """
-    try:
-        driver.get(pub["Link"])
+    page = fetch_detail_static(client, pub["Link"])
+    if page is None:
+        return None
+    return build_record(client, pub, page)
+
+def build_record(client: httpx.Client, pub: Dict[str, str], page: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds the output record from the contents of a detail page and downloads its image.
+    
+    Args:
+        client: HTTP client used to download the image.
+        pub: Basic publication info (ISSN, Title, Link).
+        page: Page contents as returned by extract_page_data or fetch_detail_static.
         
-        # Wait for detail content
-        WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "title"))
-        )
-        time.sleep(random.uniform(0.5, 1.0))
+    Returns:
+        Dictionary with full publication details.
+    """
+    # Generate UUID early to use for image filename
+    item_uuid = str(uuid.uuid4())
 
-        # Generate UUID early to use for image filename
-        item_uuid = str(uuid.uuid4())
+    # Download Image if present
+    download_image(client, page["image_src"], item_uuid, IMAGES_DIR, pub["Title"])
+    
+    # Extract fields
+    full_title = page["title"] if page["title"] is not None else pub["Title"]
 
-        # Download Image if present
-        download_image(driver, item_uuid, IMAGES_DIR, pub["Title"])
-        
-        # Extract fields
-        try:
-            h2 = driver.find_element(By.CSS_SELECTOR, "h2.title")
-            full_title = h2.text.strip()
-        except Exception:
-            full_title = pub["Title"]
-
-        other_title = extract_field(driver, "Otro título")
-        collection = extract_field(driver, "Colección")
-        description = extract_field(driver, "Descripción")
-        
-        # Geographic scope might have a link inside
-        geo_scope = extract_field(driver, "Ámbito geográfico")
+    fields = page["fields"]
+    other_title = find_field(fields, "Otro título")
+    collection = find_field(fields, "Colección")
+    description = find_field(fields, "Descripción")
+    
+    # Geographic scope might have a link inside
+    geo_scope = find_field(fields, "Ámbito geográfico")
+    
+    place = find_field(fields, "Lugar de publicación")
+    date_range = find_field(fields, "Fecha")
+    language = find_field(fields, "Idioma")
+    issues_count_str = find_field(fields, "Ejemplares")
+    pages_str = find_field(fields, "Páginas")
+    
+    # Convert to integers, None if empty
+    try:
+        issues_count = int(issues_count_str) if issues_count_str else None
+    except (ValueError, TypeError):
+        issues_count = None
+    
+    try:
+        total_pages = int(pages_str) if pages_str else None
+    except (ValueError, TypeError):
+        total_pages = None
+    
+    # Issues Link (Ejemplares button)
+    issues_link = page["issues_link"] or ""
         
-        place = extract_field(driver, "Lugar de publicación")
-        date_range = extract_field(driver, "Fecha")
-        language = extract_field(driver, "Idioma")
-        issues_count_str = extract_field(driver, "Ejemplares")
-        pages_str = extract_field(driver, "Páginas")
+    record = {
+        "uuid": item_uuid,
+        "issn": pub["ISSN"],
+        "title": full_title,
+        "other_title": other_title,
+        "collection": collection,
+        "description": description,
+        "geographic_scope": geo_scope,
+        "publication_place": place,
+        "date": date_range,
+        "language": language,
+        "issues_count": issues_count,
+        "total_pages": total_pages,
+        "detail_link": pub["Link"],
+        "issues_link": issues_link
+    }
+    return record
+
+def scrape_publication_details(driver: webdriver.Chrome, client: httpx.Client, pub: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """
+    Scrapes detailed information for a single publication.
+    
+    Args:
+        driver: Selenium WebDriver instance.
+        client: HTTP client used to download the image.
+        pub: Basic publication info (ISSN, Title, Link).
         
-        # Convert to integers, None if empty
-        try:
-            issues_count = int(issues_count_str) if issues_count_str else None
-        except (ValueError, TypeError):
-            issues_count = None
+    Returns:
+        Dictionary with full publication details or None if the page did not load in time.
         
-        try:
-            total_pages = int(pages_str) if pages_str else None
-        except (ValueError, TypeError):
-            total_pages = None
+    Raises:
+        Exception: Any other error, since it may mean the browser or chromedriver died
+            (e.g. "chrome not reachable" or a refused connection); the caller replaces the driver.
+    """
+    try:
+        driver.get(pub["Link"])
         
-        # Issues Link (Ejemplares button)
-        issues_link = ""
-        try:
-            btn = driver.find_element(By.XPATH, "//a[contains(., 'Ejemplares')]")
-            issues_link = btn.get_attribute("href")
-        except Exception:
-            pass
-            
-        record = {
-            "uuid": item_uuid,
-            "issn": pub["ISSN"],
-            "title": full_title,
-            "other_title": other_title,
-            "collection": collection,
-            "description": description,
-            "geographic_scope": geo_scope,
-            "publication_place": place,
-            "date": date_range,
-            "language": language,
-            "issues_count": issues_count,
-            "total_pages": total_pages,
-            "detail_link": pub["Link"],
-            "issues_link": issues_link
-        }
-        return record
+        # Wait for detail content, polling faster than the 0.5s default
+        # (pages reach this path when their fields are rendered by JS)
+        WebDriverWait(driver, 10, poll_frequency=0.1).until(EC.all_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "h2.title")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "label.label")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.control")),
+        ))
+
+        # Read the whole page in one go
+        page = extract_page_data(driver)
+
+        return build_record(client, pub, page)
         
-    except Exception as e:
+    except TimeoutException as e:
         print(f"Error processing publication details for {pub['Title']}: {e}")
         return None
 
+def scrape_publication_task(client: httpx.Client, pub: Dict[str, str], index: int, total: int) -> Optional[Dict[str, str]]:
+    """
+    Scrapes one publication on the current worker thread's driver.
+    
+    Args:
+        client: HTTP client used to download the image.
+        pub: Basic publication info (ISSN, Title, Link).
+        index: Position of the publication in the scrape queue (for logging).
+        total: Number of publications to scrape (for logging).
+        
+    Returns:
+        Dictionary with full publication details or None if error.
+    """
+    print(f"[{index}/{total}] Processing: {pub['Title']} ({pub['ISSN']})")
+    
+    # Try the plain HTML first; only start a browser for pages that need it.
+    # Failures only lose this publication, never the rest of the queue.
+    try:
+        record = scrape_publication_static(client, pub)
+        if record is None:
+            record = scrape_publication_details(get_driver(), client, pub)
+    except httpx.HTTPError as e:
+        # BNE is unreachable or refusing requests; skip this publication only
+        print(f"HTTP error for {pub['Title']}: {e}")
+        record = None
+    except Exception as e:
+        print(f"Error processing {pub['Title']}: {e}")
+        # The driver may have died (or never started); start a fresh one next time
+        discard_driver()
+        record = None
+    
+    # Polite delay
+    time.sleep(random.uniform(*POLITE_DELAY))
+    return record
+
+def to_csv_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts None values to empty strings for CSV compatibility."""
+    return {k: ("" if v is None else v) for k, v in record.items()}
+
 def scrape_publications():
     """Main function to coordinate the scraping process."""
     driver = setup_driver()
+    client = setup_client()
     
     try:
         # 1. Collect all available publications first
@@ -337,8 +615,8 @@ def scrape_publications():
             return
 
         # 3. Open CSV file for appending
-        file_exists = os.path.exists(OUTPUT_FILE)
-        file_is_empty = not file_exists or os.path.getsize(OUTPUT_FILE) == 0
+        file_exists = OUTPUT_FILE.exists()
+        file_is_empty = not file_exists or OUTPUT_FILE.stat().st_size == 0
         mode = 'a' if file_exists else 'w'
         
         with open(OUTPUT_FILE, mode, newline='', encoding='utf-8') as f:
@@ -352,28 +630,55 @@ def scrape_publications():
             if file_is_empty:
                 writer.writeheader()
             
-            # Now visit each link
+            # Now visit each link, one driver per worker thread.
+            # Records are written here only, so the CSV has a single writer.
             total_to_scrape = len(publications_to_scrape)
+            executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+            buffer = []
+            futures = []
+            collected = set()
             
-            for i, pub in enumerate(publications_to_scrape, 1):
-                print(f"[{i}/{total_to_scrape}] Processing: {pub['Title']} ({pub['ISSN']})")
+            try:
+                futures = [
+                    executor.submit(scrape_publication_task, client, pub, i, total_to_scrape)
+                    for i, pub in enumerate(publications_to_scrape, 1)
+                ]
                 
-                record = scrape_publication_details(driver, pub)
+                for future in as_completed(futures):
+                    collected.add(future)
+                    record = future.result()
+                    
+                    if record:
+                        buffer.append(to_csv_row(record))
+                        
+                        if len(buffer) >= CSV_FLUSH_EVERY:
+                            writer.writerows(buffer)
+                            f.flush()
+                            buffer.clear()
+            finally:
+                # Drop queued publications on error or Ctrl-C; running ones finish
+                executor.shutdown(wait=True, cancel_futures=True)
                 
-                if record:
-                    # Convert None values to empty strings for CSV compatibility
-                    csv_record = {k: ("" if v is None else v) for k, v in record.items()}
-                    writer.writerow(csv_record)
-                    f.flush()
+                # Keep the records of tasks that finished after the loop stopped,
+                # since their covers are already on disk
+                for future in futures:
+                    if future in collected or future.cancelled() or future.exception() is not None:
+                        continue
+                    record = future.result()
+                    if record:
+                        buffer.append(to_csv_row(record))
                 
-                # Polite delay
-                time.sleep(random.uniform(1.0, 2.0))
+                # Persist whatever is still buffered
+                writer.writerows(buffer)
+                f.flush()
                 
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
         print("Scraping session ended.")
         driver.quit()
+        quit_drivers()
+        client.close()
 
 if __name__ == "__main__":
     scrape_publications()
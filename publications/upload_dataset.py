@@ -6,12 +6,18 @@ Script to upload the BNE Digital Hemeroteca publications dataset to Hugging Face
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from datasets import load_dataset
-from huggingface_hub import login, HfApi
+from huggingface_hub import login, CommitOperationAdd, CommitOperationDelete, HfApi
 
 # Hugging Face repository ID
 REPO_ID = "ferjorosa/bne-hemeroteca-publications"
 
+# Location of the parquet file inside the dataset repository
+# (README.md maps the train split to this path)
+DATA_PATH_IN_REPO = "data/publications.parquet"
+
+# Prefix of the shards written by earlier push_to_hub uploads, removed on upload
+LEGACY_SHARD_PREFIX = "data/train-"
+
 def main():
     # Load environment variables from .env file
     project_root = Path(__file__).parent.parent
@@ -55,28 +61,34 @@ def main():
         print("Please ensure you have a valid Hugging Face token.")
         return
 
-    print(f"\nLoading dataset from {parquet_path}...")
+    # Upload the parquet file and README.md together in a single commit
+    operations = [
+        CommitOperationAdd(path_in_repo=DATA_PATH_IN_REPO, path_or_fileobj=str(parquet_path)),
+    ]
+    readme_path = script_dir / "README.md"
+    if readme_path.exists():
+        operations.append(CommitOperationAdd(path_in_repo="README.md", path_or_fileobj=str(readme_path)))
+    
     try:
-        # Load the parquet file as a dataset
-        dataset = load_dataset("parquet", data_files=str(parquet_path), split="train")
-        print(f"Dataset loaded: {len(dataset)} rows")
+        api = HfApi(token=hf_token)
+        api.create_repo(REPO_ID, repo_type="dataset", private=False, exist_ok=True)  # Public dataset
         
-        print(f"\nUploading to {REPO_ID}...")
-        dataset.push_to_hub(REPO_ID, private=False)  # Set to False for public dataset
+        # Remove the old push_to_hub shards in the same commit, so the rows never
+        # appear twice even if the card's configs entry is missing or edited
+        legacy_shards = [
+            path for path in api.list_repo_files(REPO_ID, repo_type="dataset")
+            if path.startswith(LEGACY_SHARD_PREFIX)
+        ]
+        operations.extend(CommitOperationDelete(path_in_repo=path) for path in legacy_shards)
         
-        # Upload README.md if it exists
-        readme_path = script_dir / "README.md"
-        if readme_path.exists():
-            print(f"\nUploading README.md...")
-            api = HfApi()
-            api.upload_file(
-                path_or_fileobj=str(readme_path),
-                path_in_repo="README.md",
-                repo_id=REPO_ID,
-                repo_type="dataset",
-                token=hf_token
-            )
-            print("README.md uploaded successfully!")
+        print(f"\nUploading {len(operations) - len(legacy_shards)} file(s) to {REPO_ID}"
+              f" and removing {len(legacy_shards)} old shard(s)...")
+        api.create_commit(
+            repo_id=REPO_ID,
+            repo_type="dataset",
+            operations=operations,
+            commit_message="Upload dataset",
+        )
         
         print("\n✅ Success! Dataset uploaded.")
         print(f"View it at: https://huggingface.co/datasets/{REPO_ID}")